@@ -4,20 +4,25 @@ Eredivisie TRMNL Service
 A FastAPI service that scrapes Eredivisie standings and serves them for TRMNL devices
 """
 
+import asyncio
 import aiohttp
+from abc import ABC, abstractmethod
+import hashlib
 import logging
 import os
 from datetime import datetime
-from typing import List, Optional
-from dataclasses import dataclass, asdict
+from functools import lru_cache
+from typing import Dict, List, Optional
+from dataclasses import dataclass
 import re
 
-from fastapi import FastAPI, HTTPException, Query, Depends, Request
+import orjson
+from fastapi import FastAPI, HTTPException, Query, Depends, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from fastapi.security.api_key import APIKeyQuery
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 import uvicorn
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -31,7 +36,27 @@ if not API_KEY:
 # API key security scheme
 api_key_query = APIKeyQuery(name="api_key", auto_error=False)
 
-@dataclass
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson"""
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+# Patterns used while parsing every table cell
+_WS_RE = re.compile(r'\s+')
+_NONDIGIT_RE = re.compile(r'[^\d-]')
+# Combined cells such as "12 | 3 | 4" (W/L/D) or "30 - 12" (goals)
+_TRIPLE_RE = re.compile(r'(-?\d+)\D+(-?\d+)\D+(-?\d+)')
+_PAIR_RE = re.compile(r'(-?\d+)\D+(-?\d+)')
+
+# Tags that make up a table row's cells
+_CELL_TAGS = frozenset(('td', 'th'))
+# Row groups that never hold team rows
+_NON_BODY_SECTIONS = frozenset(('thead', 'tfoot'))
+
+# `top` values serialized ahead of time after every update
+PRESERIALIZED_TOP = (None, 3, 5, 10)
+
+@dataclass(slots=True)
 class Team:
     position: int
     name: str
@@ -44,291 +69,317 @@ class Team:
     goal_difference: int
     points: int
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StandingsData:
     teams: List[Team]
     last_updated: str
 
-class EredivisieScraper:
+@lru_cache(maxsize=128)
+def _clean_team_name(name: str) -> str:
+    """Clean team name for display, memoized since the same names recur every scrape"""
+    # Remove extra whitespace
+    name = _WS_RE.sub(' ', name.strip())
+    return name.replace("*", "").strip()
+
+class StandingsScraper(ABC):
+    """Shared fetch/parse skeleton; subclasses describe their site's table"""
+    URL = ""
+    LEAGUE = ""
+    # Row selectors to probe, most specific first
+    SELECTORS: tuple = ()
+    # Number of teams in the league
+    EXPECTED = 0
+    # Index of the cell holding the position, used to spot rows in the fallback scan
+    POSITION_CELL = 0
+    
     def __init__(self):
-        self.url = "https://eredivisie.nl/competitie/stand/"
+        self.url = self.URL
         self.data: Optional[StandingsData] = None
+        # Shared HTTP session, assigned at startup
         self.session: Optional[aiohttp.ClientSession] = None
+        # When the site was last fetched successfully, including 304 answers
+        self.last_checked: Optional[str] = None
+        # Validators from the last successful scrape, sent back for conditional requests
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        # Serialized responses keyed by `top`, valid for the data they were built from
+        self._json_cache: Dict[Optional[int], bytes] = {}
+        self._json_cache_source: Optional[StandingsData] = None
+    
+    def standings_json(self, data: StandingsData, top: Optional[int] = None) -> bytes:
+        """Serialize a standings snapshot, reusing the result until the data changes"""
+        if data is not self._json_cache_source:
+            self._json_cache = {}
+            self._json_cache_source = data
         
-    async def __aenter__(self):
-        self.session = aiohttp.ClientSession(
-            headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'},
-            timeout=aiohttp.ClientTimeout(total=30)
-        )
-        return self
+        # Clamp `top` to an actual team count so the cache holds at most one entry per size
+        count = len(data.teams)
+        if not top or top >= count:
+            top = None
+        elif top < 0:
+            top = max(0, count + top)
         
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        payload = self._json_cache.get(top)
+        if payload is None:
+            # orjson serializes the Team dataclasses natively, no per-team dicts needed
+            teams = data.teams if top is None else data.teams[:top]
+            payload = orjson.dumps({
+                "standings": teams,
+                "last_updated": data.last_updated
+            })
+            self._json_cache[top] = payload
+        return payload
+    
+    def preserialize(self):
+        """Build the payloads for the common `top` values so requests only do a lookup"""
+        data = self.data
+        for top in PRESERIALIZED_TOP:
+            self.standings_json(data, top)
+    
+    def _conditional_headers(self) -> Dict[str, str]:
+        """Request headers that let the site answer 304 when the page is unchanged"""
+        headers = {}
+        if self._etag:
+            headers['If-None-Match'] = self._etag
+        if self._last_modified:
+            headers['If-Modified-Since'] = self._last_modified
+        return headers
     
-    def _clean_team_name(self, name: str) -> str:
-        """Clean team name for display"""
-        # Remove extra whitespace
-        name = re.sub(r'\s+', ' ', name.strip())
-        return name.replace("*", "").strip()
+    def _row_cells(self, row) -> list:
+        """Direct td/th children of a table row, without running a CSS query"""
+        return [node for node in row.iter() if node.tag in _CELL_TAGS]
+    
+    def _is_body_row(self, row) -> bool:
+        """Cheap check that a row isn't part of a table header or footer"""
+        parent = row.parent
+        return parent is None or parent.tag not in _NON_BODY_SECTIONS
+    
+    def _int_groups(self, pattern: re.Pattern, text: str, count: int) -> tuple:
+        """Extract all integers of a combined cell in one pass, zeros if it doesn't match"""
+        match = pattern.search(text)
+        return tuple(map(int, match.groups())) if match else (0,) * count
     
     def _safe_int(self, value: str) -> int:
         """Safely convert string to int"""
         try:
-            clean_value = re.sub(r'[^\d-]', '', str(value))
+            clean_value = _NONDIGIT_RE.sub('', str(value))
             return int(clean_value) if clean_value else 0
         except (ValueError, TypeError):
             return 0
     
+    @abstractmethod
+    def _parse_row(self, i: int, row, cells: list) -> Optional[Team]:
+        """Build a Team from one table row, or None if the row isn't a team"""
+    
+    def _find_rows(self, tree: LexborHTMLParser) -> list:
+        """Locate the standings table rows"""
+        rows = []
+        for selector in self.SELECTORS:
+            rows = tree.css(selector)
+            if len(rows) >= self.EXPECTED:
+                logger.info(f"Found {self.LEAGUE} table using selector: {selector}")
+                break
+        
+        if not rows:
+            # Fallback: look for any table rows with numeric data
+            rows = []
+            for row in tree.css('tr'):
+                if not self._is_body_row(row):
+                    continue
+                cells = self._row_cells(row)
+                if len(cells) >= 7:
+                    # Check if the position cell looks like a position
+                    pos_text = cells[self.POSITION_CELL].text().strip()
+                    if pos_text.isdigit() and 1 <= int(pos_text) <= self.EXPECTED:
+                        rows.append(row)
+        
+        return rows
+    
     async def scrape_standings(self) -> Optional[StandingsData]:
-        """Scrape current standings from eredivisie.nl"""
+        """Scrape current standings from the league's website"""
         try:
-            async with self.session.get(self.url) as response:
+            async with self.session.get(self.url, headers=self._conditional_headers()) as response:
+                if response.status == 304 and self.data:
+                    # The data keeps its last_updated, which is when the standings last changed
+                    logger.info(f"{self.url} not modified since last scrape")
+                    self.last_checked = datetime.now().isoformat()
+                    return self.data
+                
                 if response.status != 200:
                     logger.error(f"HTTP {response.status} when fetching {self.url}")
                     return None
                 
                 html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                teams = []
-                
-                # Try multiple table selectors
-                table_selectors = [
-                    'table.standings tbody tr',
-                    '.standings-table tbody tr',
-                    'table tbody tr',
-                    '.table tbody tr'
-                ]
-                
-                rows = []
-                for selector in table_selectors:
-                    rows = soup.select(selector)
-                    if len(rows) >= 18:  # Eredivisie has 18 teams
-                        break
-                
-                if not rows:
-                    # Fallback: look for any table rows with numeric data
-                    all_rows = soup.find_all('tr')
-                    rows = []
-                    for row in all_rows:
-                        cells = row.find_all(['td', 'th'])
-                        if len(cells) >= 7:
-                            # Check if first cell looks like a position
-                            first_cell = cells[0].get_text().strip()
-                            if first_cell.isdigit() and int(first_cell) <= 18:
-                                rows.append(row)
-                
-                logger.info(f"Found {len(rows)} table rows")
-                
-                for i, row in enumerate(rows[:18]):  # Limit to 18 teams
-                    try:
-                        cells = row.find_all(['td', 'th'])
-                        if len(cells) < 7:
-                            continue
-                            
-                        # Extract position (either from first cell or infer from order)
-                        pos_text = cells[0].get_text().strip()
-                        position = int(pos_text) if pos_text.isdigit() else i + 1
-                        
-                        # Extract team name
-                        team_name = self._clean_team_name(cells[1].get_text())
-                        if len(team_name) < 2:
-                            continue
-                        
-                        # Extract stats (adjust indices based on table structure)
-                        games = self._safe_int(cells[2].get_text()) if len(cells) > 2 else 0
-                        game_results = cells[3].get_text().split('|')
-                        wins = self._safe_int(game_results[0]) if len(game_results) > 0 else 0
-                        losses = self._safe_int(game_results[1]) if len(game_results) > 1 else 0
-                        draws = self._safe_int(game_results[2]) if len(game_results) > 2 else 0
-
-                        goals_for_against = cells[4].get_text().split('-')
-                        goals_for = self._safe_int(goals_for_against[0]) if len(goals_for_against) > 0 else 0
-                        goals_against = self._safe_int(goals_for_against[1]) if len(goals_for_against) > 1 else 0
-                        
-                        # Goal difference and points
-                        goal_diff = self._safe_int(cells[5].get_text()) if len(cells) > 5 else 0
-                        points = self._safe_int(cells[6].get_text()) if len(cells) > 6 else 0
-                        
-                        team = Team(
-                            position=position,
-                            name=team_name,
-                            games=games,
-                            wins=wins,
-                            losses=losses,
-                            draws=draws,
-                            goals_for=goals_for,
-                            goals_against=goals_against,
-                            goal_difference=goal_diff,
-                            points=points
-                        )
-                        teams.append(team)
-                        
-                    except Exception as e:
-                        logger.warning(f"Error parsing row {i}: {e}")
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+            
+            rows = self._find_rows(LexborHTMLParser(html))
+            logger.info(f"Found {len(rows)} table rows for {self.LEAGUE}")
+            
+            teams = []
+            for i, row in enumerate(rows[:self.EXPECTED]):  # Limit to the league's team count
+                try:
+                    cells = self._row_cells(row)
+                    if len(cells) < 7:  # Need at least position, team, and stats
                         continue
-                
-                if len(teams) >= 10:  # We got reasonable data
-                    # Sort by position to ensure correct order
-                    teams.sort(key=lambda x: x.position)
                     
-                    self.data = StandingsData(
-                        teams=teams,
-                        last_updated=datetime.now().isoformat()
-                    )
-                    logger.info(f"Successfully scraped {len(teams)} teams")
-                    return self.data
-                else:
-                    logger.error(f"Only found {len(teams)} teams, expected 18")
-                    return None
+                    team = self._parse_row(i, row, cells)
+                    if team:
+                        teams.append(team)
                     
+                except Exception as e:
+                    logger.warning(f"Error parsing {self.LEAGUE} row {i}: {e}")
+                    continue
+            
+            if len(teams) >= 10:  # We got reasonable data
+                # Sort by position to ensure correct order
+                teams.sort(key=lambda x: x.position)
+                
+                now = datetime.now().isoformat()
+                self.data = StandingsData(
+                    teams=teams,
+                    last_updated=now
+                )
+                self.last_checked = now
+                self._etag = etag
+                self._last_modified = last_modified
+                logger.info(f"Successfully scraped {len(teams)} {self.LEAGUE} teams")
+                return self.data
+            else:
+                logger.error(f"Only found {len(teams)} {self.LEAGUE} teams, expected {self.EXPECTED}")
+                return None
+                
         except Exception as e:
-            logger.error(f"Error scraping standings: {e}")
+            logger.error(f"Error scraping {self.LEAGUE} standings: {e}")
             return None
+
+class EredivisieScraper(StandingsScraper):
+    URL = "https://eredivisie.nl/competitie/stand/"
+    LEAGUE = "Eredivisie"
+    SELECTORS = (
+        'table.standings tbody tr',
+        '.standings-table tbody tr',
+        'table tbody tr',
+        '.table tbody tr'
+    )
+    EXPECTED = 18
+    POSITION_CELL = 0
+    
+    def _parse_row(self, i: int, row, cells: list) -> Optional[Team]:
+        """Parse a row of the eredivisie.nl standings table"""
+        # Read each cell's text once
+        texts = [cell.text() for cell in cells]
         
-class KeukenKampioenDivisieScraper(EredivisieScraper):
-    def __init__(self):
-        super().__init__()
-        self.url = "https://keukenkampioendivisie.nl/klassement"
+        # Extract position (either from first cell or infer from order)
+        pos_text = texts[0].strip()
+        position = int(pos_text) if pos_text.isdigit() else i + 1
+        
+        # Extract team name
+        team_name = _clean_team_name(texts[1])
+        if len(team_name) < 2:
+            return None
+        
+        # Extract stats (adjust indices based on table structure)
+        games = self._safe_int(texts[2]) if len(texts) > 2 else 0
+        wins, losses, draws = self._int_groups(_TRIPLE_RE, texts[3], 3)
+        goals_for, goals_against = self._int_groups(_PAIR_RE, texts[4], 2)
+        
+        # Goal difference and points
+        goal_diff = self._safe_int(texts[5]) if len(texts) > 5 else 0
+        points = self._safe_int(texts[6]) if len(texts) > 6 else 0
+        
+        return Team(
+            position=position,
+            name=team_name,
+            games=games,
+            wins=wins,
+            losses=losses,
+            draws=draws,
+            goals_for=goals_for,
+            goals_against=goals_against,
+            goal_difference=goal_diff,
+            points=points
+        )
+
+class KeukenKampioenDivisieScraper(StandingsScraper):
+    URL = "https://keukenkampioendivisie.nl/klassement"
+    LEAGUE = "KKD"
+    SELECTORS = (
+        'table.table-medium tbody tr',
+        'table.table tbody tr',
+        '.standings-table tbody tr',
+        'table tbody tr',
+        '.table tbody tr'
+    )
+    EXPECTED = 20
+    POSITION_CELL = 1
     
-    async def scrape_standings(self) -> Optional[StandingsData]:
-        """Scrape current standings from keukenkampioendivisie.nl"""
-        try:
-            async with self.session.get(self.url) as response:
-                if response.status != 200:
-                    logger.error(f"HTTP {response.status} when fetching {self.url}")
-                    return None
-                
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                teams = []
-                
-                # Try multiple table selectors for KKD website
-                table_selectors = [
-                    'table.table-medium tbody tr',
-                    'table.table tbody tr',
-                    '.standings-table tbody tr',
-                    'table tbody tr',
-                    '.table tbody tr'
-                ]
-                
-                rows = []
-                for selector in table_selectors:
-                    rows = soup.select(selector)
-                    if len(rows) >= 20:  # KKD has 20 teams
-                        logger.info(f"Found KKD table using selector: {selector}")
-                        break
-                
-                if not rows:
-                    # Fallback: look for any table rows with numeric data
-                    all_rows = soup.find_all('tr')
-                    rows = []
-                    for row in all_rows:
-                        cells = row.find_all(['td', 'th'])
-                        if len(cells) >= 7:
-                            # Check if second cell looks like a position
-                            if len(cells) > 1:
-                                pos_cell = cells[1].get_text().strip()
-                                if pos_cell.isdigit() and 1 <= int(pos_cell) <= 20:
-                                    rows.append(row)
-                
-                logger.info(f"Found {len(rows)} table rows for KKD")
-                
-                for i, row in enumerate(rows[:20]):  # Limit to 20 teams
-                    try:
-                        cells = row.find_all(['td', 'th'])
-                        if len(cells) < 7:  # Need at least position, team, and stats
-                            continue
-                            
-                        # Get position from the second cell (index 1)
-                        position = self._safe_int(cells[1].get_text().strip())
-                        if position <= 0 or position > 20:
-                            position = i + 1  # Fallback to row index
-                        
-                        # Get team name - check both possible locations
-                        team_name = None
-                        
-                        # First try the hidden lg:table-cell with the team name
-                        team_cell = row.select_one('td.font-bold.hidden.lg\:table-cell')
-                        if team_cell and team_cell.find('a'):
-                            team_name = self._clean_team_name(team_cell.find('a').get_text())
-                        
-                        # If that didn't work, try the image alt text
-                        if not team_name and cells[2].find('img'):
-                            img = cells[2].find('img')
-                            if img.get('alt'):
-                                team_name = self._clean_team_name(img.get('alt'))
-                        
-                        # Last resort, try the fourth cell
-                        if not team_name and len(cells) > 3:
-                            team_name = self._clean_team_name(cells[3].get_text())
-                        
-                        if not team_name or len(team_name) < 2:
-                            logger.warning(f"Could not extract team name from row {i+1}")
-                            continue
-                        
-                        # Get games played
-                        games = self._safe_int(cells[4].get_text() if len(cells) > 4 else "0")
-                        
-                        # Parse W/G/V (wins, draws, losses)
-                        wgv_text = cells[5].get_text().strip() if len(cells) > 5 else "0/0/0"
-                        wgv_parts = wgv_text.split('/')
-                        wins = self._safe_int(wgv_parts[0].strip()) if len(wgv_parts) > 0 else 0
-                        draws = self._safe_int(wgv_parts[1].strip()) if len(wgv_parts) > 1 else 0
-                        losses = self._safe_int(wgv_parts[2].strip()) if len(wgv_parts) > 2 else 0
-                        
-                        # Get points
-                        points = self._safe_int(cells[6].get_text() if len(cells) > 6 else "0")
-                        
-                        # Parse DV/DT (goals for/against)
-                        dvdt_text = cells[7].get_text().strip() if len(cells) > 7 else "0/0"
-                        dvdt_parts = dvdt_text.split('/')
-                        goals_for = self._safe_int(dvdt_parts[0].strip()) if len(dvdt_parts) > 0 else 0
-                        goals_against = self._safe_int(dvdt_parts[1].strip()) if len(dvdt_parts) > 1 else 0
-                        
-                        # Get goal difference
-                        goal_diff = self._safe_int(cells[8].get_text() if len(cells) > 8 else "0")
-                        
-                        # Handle special case for Vitesse with negative points
-                        if "vitesse" in team_name.lower() and points < 0:
-                            logger.info(f"Found Vitesse with {points} points")
-                        
-                        teams.append(Team(
-                            position=position,
-                            name=team_name,
-                            games=games,
-                            wins=wins,
-                            draws=draws,
-                            losses=losses,
-                            goals_for=goals_for,
-                            goals_against=goals_against,
-                            goal_difference=goal_diff,
-                            points=points
-                        ))
-                        
-                    except Exception as e:
-                        logger.warning(f"Error parsing KKD row {i}: {e}")
-                        continue
-                
-                if len(teams) >= 10:  # We got reasonable data
-                    # Sort by position to ensure correct order
-                    teams.sort(key=lambda x: x.position)
-                    
-                    self.data = StandingsData(
-                        teams=teams,
-                        last_updated=datetime.now().isoformat()
-                    )
-                    logger.info(f"Successfully scraped {len(teams)} KKD teams")
-                    return self.data
-                else:
-                    logger.error(f"Only found {len(teams)} teams, expected 20")
-                    return None
-                    
-        except Exception as e:
-            logger.error(f"Error scraping KKD standings: {e}")
+    def _parse_row(self, i: int, row, cells: list) -> Optional[Team]:
+        """Parse a row of the keukenkampioendivisie.nl standings table"""
+        # Read each cell's text once
+        texts = [cell.text() for cell in cells]
+        
+        # Get position from the second cell (index 1)
+        position = self._safe_int(texts[1].strip())
+        if position <= 0 or position > 20:
+            position = i + 1  # Fallback to row index
+        
+        # Get team name - check both possible locations
+        team_name = None
+        
+        # First try the hidden lg:table-cell with the team name
+        team_cell = row.css_first(r'td.font-bold.hidden.lg\:table-cell')
+        team_link = team_cell.css_first('a') if team_cell else None
+        if team_link:
+            team_name = _clean_team_name(team_link.text())
+        
+        # If that didn't work, try the image alt text
+        img = cells[2].css_first('img') if not team_name else None
+        if img and img.attributes.get('alt'):
+            team_name = _clean_team_name(img.attributes['alt'])
+        
+        # Last resort, try the fourth cell
+        if not team_name and len(cells) > 3:
+            team_name = _clean_team_name(texts[3])
+        
+        if not team_name or len(team_name) < 2:
+            logger.warning(f"Could not extract team name from row {i+1}")
             return None
+        
+        # Get games played
+        games = self._safe_int(texts[4] if len(texts) > 4 else "0")
+        
+        # Parse W/G/V (wins, draws, losses)
+        wgv_text = texts[5] if len(texts) > 5 else ""
+        wins, draws, losses = self._int_groups(_TRIPLE_RE, wgv_text, 3)
+        
+        # Get points
+        points = self._safe_int(texts[6] if len(texts) > 6 else "0")
+        
+        # Parse DV/DT (goals for/against)
+        dvdt_text = texts[7] if len(texts) > 7 else ""
+        goals_for, goals_against = self._int_groups(_PAIR_RE, dvdt_text, 2)
+        
+        # Get goal difference
+        goal_diff = self._safe_int(texts[8] if len(texts) > 8 else "0")
+        
+        # Handle special case for Vitesse with negative points
+        if "vitesse" in team_name.lower() and points < 0:
+            logger.info(f"Found Vitesse with {points} points")
+        
+        return Team(
+            position=position,
+            name=team_name,
+            games=games,
+            wins=wins,
+            draws=draws,
+            losses=losses,
+            goals_for=goals_for,
+            goals_against=goals_against,
+            goal_difference=goal_diff,
+            points=points
+        )
+
 # Global scraper instances
 scraper = EredivisieScraper()
 kkd_scraper = KeukenKampioenDivisieScraper()
@@ -337,7 +388,8 @@ kkd_scraper = KeukenKampioenDivisieScraper()
 app = FastAPI(
     title="Eredivisie & KKD TRMNL Service",
     description="Eredivisie and Keuken Kampioen Divisie standings data for TRMNL devices",
-    version="1.1.0"
+    version="1.1.0",
+    default_response_class=ORJSONResponse
 )
 
 # API key dependency
@@ -364,102 +416,147 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Scheduler for periodic updates
-scheduler = AsyncIOScheduler()
+# Interval between periodic updates, in seconds
+UPDATE_INTERVAL = 60 * 60
+
+async def periodic_updates():
+    """Refresh the standings every UPDATE_INTERVAL seconds until cancelled"""
+    while True:
+        await asyncio.sleep(UPDATE_INTERVAL)
+        try:
+            await update_standings()
+        except Exception as e:
+            logger.error(f"Error in periodic standings update: {e}")
 
 async def update_standings():
     """Periodic task to update standings"""
-    # Update Eredivisie standings
-    logger.info("Updating Eredivisie standings...")
-    async with EredivisieScraper() as scraper_instance:
-        await scraper_instance.scrape_standings()
-        if scraper_instance.data:
-            scraper.data = scraper_instance.data
-            logger.info("Eredivisie standings updated successfully")
-        else:
-            logger.error("Failed to update Eredivisie standings")
+    # Both sites are independent, so fetch them concurrently
+    logger.info("Updating Eredivisie and Keuken Kampioen Divisie standings...")
+    eredivisie_result, kkd_result = await asyncio.gather(
+        scraper.scrape_standings(),
+        kkd_scraper.scrape_standings(),
+        return_exceptions=True
+    )
+    
+    if isinstance(eredivisie_result, StandingsData):
+        scraper.data = eredivisie_result
+        scraper.preserialize()
+        logger.info("Eredivisie standings updated successfully")
+    else:
+        if isinstance(eredivisie_result, BaseException):
+            logger.error(f"Error updating Eredivisie standings: {eredivisie_result}")
+        logger.error("Failed to update Eredivisie standings")
     
-    # Update KKD standings
-    logger.info("Updating Keuken Kampioen Divisie standings...")
-    async with KeukenKampioenDivisieScraper() as kkd_scraper_instance:
-        await kkd_scraper_instance.scrape_standings()
-        if kkd_scraper_instance.data:
-            kkd_scraper.data = kkd_scraper_instance.data
-            logger.info("KKD standings updated successfully")
-        else:
-            logger.error("Failed to update KKD standings")
+    if isinstance(kkd_result, StandingsData):
+        kkd_scraper.data = kkd_result
+        kkd_scraper.preserialize()
+        logger.info("KKD standings updated successfully")
+    else:
+        if isinstance(kkd_result, BaseException):
+            logger.error(f"Error updating KKD standings: {kkd_result}")
+        logger.error("Failed to update KKD standings")
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize the service"""
     logger.info("Starting Eredivisie TRMNL Service...")
     
+    # Shared HTTP session, reused by every scrape to keep connections alive
+    app.state.session = aiohttp.ClientSession(
+        headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'},
+        timeout=aiohttp.ClientTimeout(total=30),
+        connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300, keepalive_timeout=30)
+    )
+    
+    scraper.session = app.state.session
+    kkd_scraper.session = app.state.session
+    
     # Initial data fetch
     await update_standings()
     
     # Schedule updates every 60 minutes
-    scheduler.add_job(
-        update_standings,
-        'interval',
-        minutes=60,
-        id='update_standings'
-    )
-    scheduler.start()
+    app.state.update_task = asyncio.create_task(periodic_updates())
     logger.info("Service started successfully")
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown"""
-    scheduler.shutdown()
+    app.state.update_task.cancel()
+    await app.state.session.close()
     logger.info("Service stopped")
 
 @app.get("/")
 async def root(authorized: bool = Depends(verify_api_key)):
     """Health check endpoint"""
+    eredivisie_data = scraper.data
+    kkd_data = kkd_scraper.data
     return {
         "service": "Eredivisie & KKD TRMNL Service",
         "status": "running",
-        "eredivisie_last_updated": scraper.data.last_updated if scraper.data else None,
-        "eredivisie_teams_count": len(scraper.data.teams) if scraper.data else 0,
-        "kkd_last_updated": kkd_scraper.data.last_updated if kkd_scraper.data else None,
-        "kkd_teams_count": len(kkd_scraper.data.teams) if kkd_scraper.data else 0
+        "eredivisie_last_updated": eredivisie_data.last_updated if eredivisie_data else None,
+        "eredivisie_last_checked": scraper.last_checked,
+        "eredivisie_teams_count": len(eredivisie_data.teams) if eredivisie_data else 0,
+        "kkd_last_updated": kkd_data.last_updated if kkd_data else None,
+        "kkd_last_checked": kkd_scraper.last_checked,
+        "kkd_teams_count": len(kkd_data.teams) if kkd_data else 0
+    }
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header (a list of tags or `*`) against our ETag"""
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == "*" or tag == etag:
+            return True
+    return False
+
+def standings_response(
+    request: Request,
+    source: StandingsScraper,
+    data: StandingsData,
+    top: Optional[int]
+) -> Response:
+    """Build a cacheable standings response, answering 304 if the client copy is current"""
+    etag = f'"{hashlib.md5(data.last_updated.encode()).hexdigest()}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "public, max-age=3600"
     }
+    
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    
+    return Response(content=source.standings_json(data, top), media_type="application/json", headers=headers)
 
 @app.get("/standings")
 async def get_standings(
+    request: Request,
     authorized: bool = Depends(verify_api_key),
     top: Optional[int] = Query(None, description="Number of top teams to return")
 ):
     """Get current Eredivisie standings"""
-    if not scraper.data:
+    # Read the shared reference once so teams and timestamp come from the same update
+    data = scraper.data
+    if not data:
         raise HTTPException(status_code=503, detail="Eredivisie standings data not available")
     
-    teams = scraper.data.teams
-    if top:
-        teams = teams[:top]
-    
-    return {
-        "standings": [asdict(team) for team in teams],
-        "last_updated": scraper.data.last_updated
-    }
+    return standings_response(request, scraper, data, top)
 
 @app.get("/kkd-standings")
 async def get_kkd_standings(
+    request: Request,
     authorized: bool = Depends(verify_api_key),
     top: Optional[int] = Query(None, description="Number of top teams to return")
 ):
     """Get current Keuken Kampioen Divisie standings"""
-    if not kkd_scraper.data:
+    data = kkd_scraper.data
+    if not data:
         raise HTTPException(status_code=503, detail="Keuken Kampioen Divisie standings data not available")
     
-    teams = kkd_scraper.data.teams
-    if top:
-        teams = teams[:top]
-    
-    return {
-        "standings": [asdict(team) for team in teams],
-        "last_updated": kkd_scraper.data.last_updated
-    }
+    return standings_response(request, kkd_scraper, data, top)
 
 if __name__ == "__main__":
     uvicorn.run(